@@ -7,6 +7,7 @@ from functools import lru_cache
 from pathlib import Path
 from typing import List
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Read version from pyproject.toml
@@ -36,6 +37,10 @@ class Settings(BaseSettings):
     port: int = 8000
     api_version: str = _get_version()
     reload: bool = True
+    # Event loop / HTTP parser implementations (uvicorn --loop / --http);
+    # "auto" picks uvloop / httptools when installed (uvicorn[standard])
+    loop: str = "auto"
+    http: str = "auto"
 
     # CORS configuration (comma-separated list in env var)
     cors_origins: List[str] = ["http://localhost:5173"]
@@ -61,12 +66,14 @@ class Settings(BaseSettings):
     scraper_wait_timeout: int = 2000  # milliseconds
     gemini_scraper_wait_timeout: int = 3000  # milliseconds
 
+    # Maximum number of providers fetched at the same time during refresh
+    provider_fetch_concurrency: int = Field(4, ge=1)
+
 
 @lru_cache
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get cached settings instance.
 
-
-# Convenience alias
-settings = get_settings()
+    Settings are created on first use rather than at import time.
+    """
+    return Settings()
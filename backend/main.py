@@ -4,18 +4,18 @@ import logging
 from contextlib import asynccontextmanager
 from typing import List, Optional
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Response
 from pydantic import BaseModel
-from fastapi.middleware.cors import CORSMiddleware
 
-from config import settings
+from config import Settings, get_settings
+from middleware import CORSLite
 from models import ModelPricing, ProviderInfo
 from services import PricingService, Fetcher
 
 # Configure logging from settings
 logging.basicConfig(
-    level=getattr(logging, settings.log_level.upper(), logging.INFO),
-    format=settings.log_format,
+    level=getattr(logging, get_settings().log_level.upper(), logging.INFO),
+    format=get_settings().log_format,
 )
 logger = logging.getLogger(__name__)
 
@@ -55,14 +55,14 @@ async def lifespan(app: FastAPI):
 app = FastAPI(
     title="Model Price API",
     description="API for AI model pricing comparison",
-    version=settings.api_version,
+    version=get_settings().api_version,
     lifespan=lifespan,
 )
 
 # CORS configuration from settings
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    CORSLite,
+    origins=get_settings().cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -70,7 +70,7 @@ app.add_middleware(
 
 
 @app.get("/")
-async def root():
+async def root(settings: Settings = Depends(get_settings)):
     """API root."""
     return {
         "message": "Welcome to Model Price API",
@@ -98,16 +98,20 @@ async def list_models(
     search: Optional[str] = Query(None, description="Search model name"),
     sort_by: str = Query("model_name", description="Sort field"),
     sort_order: str = Query("asc", description="Sort order: asc or desc"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of models"),
 ):
-    """List all models with optional filters and sorting."""
-    return PricingService.get_all(
+    """List all models with optional filters, sorting and limit."""
+    # Send orjson bytes directly; response_model only documents the schema
+    content = PricingService.get_all_json(
         provider=provider,
         capability=capability,
         family=family,
         search=search,
         sort_by=sort_by,
         sort_order=sort_order,
+        limit=limit,
     )
+    return Response(content=content, media_type="application/json")
 
 
 @app.get("/api/models/{model_id:path}", response_model=ModelPricing)
@@ -199,9 +203,12 @@ async def refresh_metadata():
 if __name__ == "__main__":
     import uvicorn
 
+    settings = get_settings()
     uvicorn.run(
         "main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.reload,
+        loop=settings.loop,
+        http=settings.http,
     )
@@ -0,0 +1,3 @@
+from .cors import CORSLite
+
+__all__ = ["CORSLite"]
@@ -0,0 +1,181 @@
+"""Lightweight pure-ASGI CORS middleware."""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+Header = Tuple[bytes, bytes]
+
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+# CORS-safelisted request headers, always accepted in preflights
+SAFELISTED_HEADERS = ("Accept", "Accept-Language", "Content-Language", "Content-Type")
+
+PREFLIGHT_VARY = b"Origin, Access-Control-Request-Method, Access-Control-Request-Headers"
+
+
+def _join(values: Iterable[str]) -> bytes:
+    """Join header values once into their wire format."""
+    return b", ".join(v.encode("latin-1") for v in values)
+
+
+class CORSLite:
+    """CORS middleware operating directly on ASGI messages.
+
+    Mirrors the options of Starlette's CORSMiddleware, but every header value
+    is joined and encoded once at startup. For configured origins the full
+    response header list is pre-built too, so the per-request path is a dict
+    lookup plus a list concatenation.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        origins: Iterable[str],
+        allow_methods: Sequence[str] = ("GET",),
+        allow_headers: Sequence[str] = (),
+        allow_credentials: bool = False,
+        expose_headers: Sequence[str] = (),
+        max_age: int = 600,
+    ) -> None:
+        self.app = app
+        origin_list = list(origins)
+        self._allow_all_origins = "*" in origin_list
+        self._origin_set = frozenset(
+            o.encode("latin-1") for o in origin_list if o != "*"
+        )
+        # Wildcard headers: echo back whatever the browser asked for
+        self._allow_all_headers = "*" in allow_headers
+        if not self._allow_all_headers:
+            allow_headers = sorted(set(SAFELISTED_HEADERS) | set(allow_headers))
+
+        methods = ALL_METHODS if "*" in allow_methods else allow_methods
+        self._allow_methods = frozenset(m.encode("latin-1") for m in methods)
+        self._allow_headers = frozenset(h.lower() for h in allow_headers)
+        self._allow_methods_b = _join(methods)
+        self._allow_headers_b = _join(allow_headers)
+        self._expose_headers_b = _join(expose_headers)
+        self._max_age_b = str(max_age).encode()
+
+        # Headers shared by every response regardless of origin
+        common: List[Header] = []
+        if allow_credentials:
+            common.append((b"access-control-allow-credentials", b"true"))
+
+        self._preflight_headers: Tuple[Header, ...] = (
+            (b"access-control-allow-methods", self._allow_methods_b),
+            (b"access-control-max-age", self._max_age_b),
+            (b"vary", PREFLIGHT_VARY),
+            *common,
+        )
+        if not self._allow_all_headers:
+            self._preflight_headers += (
+                (b"access-control-allow-headers", self._allow_headers_b),
+            )
+
+        self._resp_headers_tuple: Tuple[Header, ...] = (*common, (b"vary", b"Origin"))
+        if expose_headers:
+            self._resp_headers_tuple += (
+                (b"access-control-expose-headers", self._expose_headers_b),
+            )
+
+        # Fully assembled response headers per configured origin
+        self._resp_headers_by_origin: Dict[bytes, List[Header]] = {
+            origin: [(b"access-control-allow-origin", origin), *self._resp_headers_tuple]
+            for origin in self._origin_set
+        }
+        # Disallowed origins get no CORS headers, but caches must still key
+        # the response on Origin
+        self._disallowed_headers: List[Header] = [(b"vary", b"Origin")]
+
+    def _is_allowed(self, origin: bytes) -> bool:
+        return self._allow_all_origins or origin in self._origin_set
+
+    def _response_headers(self, origin: bytes) -> List[Header]:
+        """Return the headers to add to a simple (non-preflight) response."""
+        headers = self._resp_headers_by_origin.get(origin)
+        if headers is not None:
+            return headers
+        if self._allow_all_origins:
+            return [(b"access-control-allow-origin", origin), *self._resp_headers_tuple]
+        return self._disallowed_headers
+
+    def _preflight_failures(
+        self, origin: bytes, method: bytes, request_headers: Optional[bytes]
+    ) -> List[str]:
+        """List the parts of a preflight request that are not allowed."""
+        failures = []
+        if not self._is_allowed(origin):
+            failures.append("origin")
+        if method not in self._allow_methods:
+            failures.append("method")
+        if request_headers is not None and not self._allow_all_headers:
+            requested = request_headers.decode("latin-1").lower().split(",")
+            if any(h.strip() not in self._allow_headers for h in requested):
+                failures.append("headers")
+        return failures
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin: Optional[bytes] = None
+        request_method: Optional[bytes] = None
+        request_headers: Optional[bytes] = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        # Not a CORS request - pass through untouched
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(origin, request_method, request_headers, send)
+            return
+
+        extra_headers = self._response_headers(origin)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + extra_headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _preflight(
+        self,
+        origin: bytes,
+        method: bytes,
+        request_headers: Optional[bytes],
+        send: Send,
+    ) -> None:
+        """Answer a preflight request without touching the application.
+
+        Like Starlette, a disallowed origin, method or header is rejected with
+        a 400 naming the failed checks.
+        """
+        headers = list(self._preflight_headers)
+        failures = self._preflight_failures(origin, method, request_headers)
+        if "origin" not in failures:
+            headers.append((b"access-control-allow-origin", origin))
+        if self._allow_all_headers and request_headers is not None:
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        if failures:
+            body = ("Disallowed CORS " + ", ".join(failures)).encode()
+            headers += [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(body)).encode()),
+            ]
+            await send({"type": "http.response.start", "status": 400, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        await send({"type": "http.response.start", "status": 204, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
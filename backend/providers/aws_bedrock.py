@@ -3,12 +3,15 @@
 import asyncio
 import logging
 import re
+import string
 from datetime import datetime
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import httpx
+import orjson
 
-from config import settings
+from config import get_settings
 from models import ModelPricing, Pricing, BatchPricing
 from .base import BaseProvider, detect_modalities
 from .registry import ProviderRegistry
@@ -27,6 +30,28 @@ MODEL_PATTERNS: List[Tuple[str, str, str]] = [
     (r"deepseek", "deepseek", "DeepSeek"),
 ]
 
+_COMPILED_MODEL_PATTERNS: List[Tuple[re.Pattern[str], str, str]] = [
+    (re.compile(pattern, re.IGNORECASE), model_id, display_name)
+    for pattern, model_id, display_name in MODEL_PATTERNS
+]
+
+# Usage type suffixes for non-standard pricing tiers (flex, priority, etc.)
+SKIP_TIER_PATTERNS = ("-flex", "-priority", "-latency-optimized", "-custom-model")
+
+# Precompiled patterns for per-SKU name handling
+_RE_BAD_CHARS = re.compile(r"[^a-z0-9\s\-\.]")
+_RE_WS = re.compile(r"\s+")
+
+# str.translate table equivalent to _RE_BAD_CHARS for ASCII input:
+# drops disallowed characters and maps every whitespace character to a space
+_ID_ALLOWED_CHARS = frozenset(string.ascii_lowercase + string.digits + " -.")
+_ID_TRANSLATE_TABLE: Dict[int, Optional[str]] = {
+    c: (" " if chr(c).isspace() else None)
+    for c in range(128)
+    if chr(c) not in _ID_ALLOWED_CHARS
+}
+_RE_BEDROCK_SUFFIX = re.compile(r"\s*\(Amazon Bedrock Edition\)\s*$")
+
 
 class AWSBedrockProvider(BaseProvider):
     """Provider for AWS Bedrock pricing data."""
@@ -36,7 +61,10 @@ class AWSBedrockProvider(BaseProvider):
 
     async def fetch(self) -> List[ModelPricing]:
         """Fetch pricing from both Bedrock sources."""
-        async with httpx.AsyncClient(timeout=settings.http_timeout) as client:
+        settings = get_settings()
+        # Both files live on the same host: HTTP/2 multiplexes the two
+        # requests over a single connection instead of two TLS handshakes
+        async with httpx.AsyncClient(timeout=settings.http_timeout, http2=True) as client:
             # Fetch both sources concurrently
             bedrock_resp, fm_resp = await asyncio.gather(
                 client.get(settings.bedrock_url),
@@ -45,31 +73,68 @@ class AWSBedrockProvider(BaseProvider):
             bedrock_resp.raise_for_status()
             fm_resp.raise_for_status()
 
-            bedrock_data = bedrock_resp.json()
-            fm_data = fm_resp.json()
+        # Decoding and parsing are CPU-bound - run them in a worker thread so
+        # the event loop keeps serving requests during refresh
+        return await asyncio.to_thread(
+            self._parse_all, bedrock_resp.content, fm_resp.content
+        )
+
+    def _parse_all(self, bedrock_raw: bytes, fm_raw: bytes) -> List[ModelPricing]:
+        """Decode and parse both Bedrock sources into a single model list.
 
+        Foundation Models prices are applied on top of the AmazonBedrock ones
+        (global rates override), so the two passes must run in this order.
+        """
         models: Dict[str, ModelPricing] = {}
 
+        # Each document is decoded right before its pass and released after,
+        # so only one decoded document is held in memory at a time
+
         # Parse AmazonBedrock data
-        self._parse_bedrock_data(bedrock_data, models)
+        self._parse_bedrock_data(*self._load_offer(bedrock_raw), models)
 
         # Parse AmazonBedrockFoundationModels data
-        self._parse_fm_data(fm_data, models)
+        self._parse_fm_data(*self._load_offer(fm_raw), models)
 
         return list(models.values())
 
+    @staticmethod
+    def _load_offer(
+        raw: bytes,
+    ) -> Tuple[Iterator[Tuple[str, dict]], Dict[str, dict]]:
+        """Decode an AWS offer file into only the parts the parsers use.
+
+        Returns:
+            Tuple of ((sku, attributes) iterator, OnDemand price dimension by sku).
+            The rest of the document is dropped right after decoding.
+        """
+        data = orjson.loads(raw)
+        products: Dict[str, dict] = data.get("products", {})
+        terms: Dict[str, dict] = data.get("terms", {}).get("OnDemand", {})
+        attrs = ((sku, product.get("attributes", {})) for sku, product in products.items())
+
+        # Flatten sku -> term -> priceDimensions to sku -> first price dimension
+        price_dims: Dict[str, dict] = {}
+        for sku, term_data in terms.items():
+            term = next(iter(term_data.values()), None)
+            if term:
+                price_dim = next(iter(term["priceDimensions"].values()), None)
+                if price_dim:
+                    price_dims[sku] = price_dim
+        return attrs, price_dims
+
     def _parse_bedrock_data(
-        self, data: dict, models: Dict[str, ModelPricing]
+        self,
+        products: Iterable[Tuple[str, dict]],
+        price_dims: Dict[str, dict],
+        models: Dict[str, ModelPricing],
     ) -> None:
         """Parse AmazonBedrock pricing data.
 
         NOTE: This data source prices are per 1K tokens, need to convert to per Million.
         """
-        products = data.get("products", {})
-        terms = data.get("terms", {}).get("OnDemand", {})
-
-        for sku, product in products.items():
-            attrs = product.get("attributes", {})
+        now = datetime.now()
+        for sku, attrs in products:
             model_name = attrs.get("model", "")
             if not model_name:
                 continue
@@ -86,28 +151,26 @@ class AWSBedrockProvider(BaseProvider):
                 continue
             # Skip special pricing tiers: flex, priority, latency-optimized, custom-model
             # These are not standard on-demand pricing
-            skip_patterns = ["-flex", "-priority", "-latency-optimized", "-custom-model"]
-            if any(p in usage_type.lower() for p in skip_patterns):
+            usage_lower = usage_type.lower()
+            if any(p in usage_lower for p in SKIP_TIER_PATTERNS):
                 continue
 
             # Get price
-            term_data = terms.get(sku)
-            if not term_data:
+            price_dim = price_dims.get(sku)
+            if not price_dim:
                 continue
 
-            term = list(term_data.values())[0]
-            price_dim = list(term["priceDimensions"].values())[0]
             # Price is per 1K tokens in this data source - convert to per Million
             price_per_1k = float(price_dim["pricePerUnit"].get("USD", "0"))
             price_usd = price_per_1k * 1000  # Convert to per Million tokens
-            description = price_dim.get("description", "")
+            desc_lower = price_dim.get("description", "").lower()
 
             # Determine price type from description/usagetype
-            is_input = "input" in usage_type.lower() or "input" in description.lower()
-            is_output = "output" in usage_type.lower() or "output" in description.lower()
-            is_batch = "batch" in usage_type.lower() or "batch" in description.lower()
-            is_cache_read = "cache-read" in usage_type.lower()
-            is_cache_write = "cache-write" in usage_type.lower()
+            is_input = "input" in usage_lower or "input" in desc_lower
+            is_output = "output" in usage_lower or "output" in desc_lower
+            is_batch = "batch" in usage_lower or "batch" in desc_lower
+            is_cache_read = "cache-read" in usage_lower
+            is_cache_write = "cache-write" in usage_lower
 
             # Create or update model
             model_id, display_name = self._normalize_model_id(model_name)
@@ -118,17 +181,18 @@ class AWSBedrockProvider(BaseProvider):
                 capabilities = self._detect_capabilities(display_name)
                 input_mods, output_mods = detect_modalities(capabilities, display_name)
 
-                models[full_id] = ModelPricing(
+                # Fields are built here from already-typed values, so skip validation
+                models[full_id] = ModelPricing.model_construct(
                     id=full_id,
                     provider=self.name,
                     model_id=model_id,
                     model_name=display_name,
-                    pricing=Pricing(),
+                    pricing=Pricing.model_construct(),
                     batch_pricing=None,
                     capabilities=capabilities,
                     input_modalities=input_mods,
                     output_modalities=output_mods,
-                    last_updated=datetime.now(),
+                    last_updated=now,
                 )
 
             model = models[full_id]
@@ -136,7 +200,7 @@ class AWSBedrockProvider(BaseProvider):
             # Update prices - only if not already set (first value wins)
             if is_batch:
                 if model.batch_pricing is None:
-                    model.batch_pricing = BatchPricing()
+                    model.batch_pricing = BatchPricing.model_construct()
                 if is_input and model.batch_pricing.input is None:
                     model.batch_pricing.input = price_usd
                 elif is_output and model.batch_pricing.output is None:
@@ -155,34 +219,32 @@ class AWSBedrockProvider(BaseProvider):
                     model.pricing.output = price_usd
 
     def _parse_fm_data(
-        self, data: dict, models: Dict[str, ModelPricing]
+        self,
+        products: Iterable[Tuple[str, dict]],
+        price_dims: Dict[str, dict],
+        models: Dict[str, ModelPricing],
     ) -> None:
         """Parse AmazonBedrockFoundationModels pricing data.
 
         NOTE: This data source prices are per Million tokens (standard unit).
         """
-        products = data.get("products", {})
-        terms = data.get("terms", {}).get("OnDemand", {})
-
-        for sku, product in products.items():
-            attrs = product.get("attributes", {})
+        now = datetime.now()
+        for sku, attrs in products:
             service_name = attrs.get("servicename", "")
             if not service_name:
                 continue
 
             # Extract model name from service name
             # e.g., "Claude 3.5 Sonnet (Amazon Bedrock Edition)" -> "Claude 3.5 Sonnet"
-            model_name = re.sub(r"\s*\(Amazon Bedrock Edition\)\s*$", "", service_name)
+            model_name = _RE_BEDROCK_SUFFIX.sub("", service_name)
 
             usage_type = attrs.get("usagetype", "")
 
             # Get price
-            term_data = terms.get(sku)
-            if not term_data:
+            price_dim = price_dims.get(sku)
+            if not price_dim:
                 continue
 
-            term = list(term_data.values())[0]
-            price_dim = list(term["priceDimensions"].values())[0]
             price_usd = float(price_dim["pricePerUnit"].get("USD", "0"))
             description = price_dim.get("description", "")
 
@@ -217,17 +279,18 @@ class AWSBedrockProvider(BaseProvider):
                 capabilities = self._detect_capabilities(display_name)
                 input_mods, output_mods = detect_modalities(capabilities, display_name)
 
-                models[full_id] = ModelPricing(
+                # Fields are built here from already-typed values, so skip validation
+                models[full_id] = ModelPricing.model_construct(
                     id=full_id,
                     provider=self.name,
                     model_id=model_id,
                     model_name=display_name,
-                    pricing=Pricing(),
+                    pricing=Pricing.model_construct(),
                     batch_pricing=None,
                     capabilities=capabilities,
                     input_modalities=input_mods,
                     output_modalities=output_mods,
-                    last_updated=datetime.now(),
+                    last_updated=now,
                 )
 
             model = models[full_id]
@@ -236,7 +299,7 @@ class AWSBedrockProvider(BaseProvider):
             # Prefer global pricing over regional (global is standard, regional has ~10% premium)
             if is_batch:
                 if model.batch_pricing is None:
-                    model.batch_pricing = BatchPricing()
+                    model.batch_pricing = BatchPricing.model_construct()
                 if is_input:
                     # Prefer global batch pricing
                     if model.batch_pricing.input is None or not is_regional:
@@ -334,22 +397,34 @@ class AWSBedrockProvider(BaseProvider):
 
         return capabilities
 
-    def _normalize_model_id(self, name: str) -> Tuple[str, str]:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _normalize_model_id(name: str) -> Tuple[str, str]:
         """Normalize model name to ID format and return display name.
 
+        Cached: every model has several SKUs (input/output/batch/cache) that
+        all carry the same name.
+
         Returns:
             Tuple of (model_id, display_name)
         """
         name_lower = name.lower()
         
         # Check against known patterns first
-        for pattern, model_id, display_name in MODEL_PATTERNS:
-            if re.search(pattern, name_lower, re.IGNORECASE):
+        for pattern, model_id, display_name in _COMPILED_MODEL_PATTERNS:
+            if pattern.search(name_lower):
                 return model_id, display_name
         
         # Default: lowercase, replace spaces with hyphens, remove special chars
-        model_id = re.sub(r"[^a-z0-9\s\-\.]", "", name_lower)
-        model_id = re.sub(r"\s+", "-", model_id)
+        if name_lower.isascii():
+            # Fast path: table lookup instead of the regex engine
+            model_id = name_lower.translate(_ID_TRANSLATE_TABLE)
+            while "  " in model_id:
+                model_id = model_id.replace("  ", " ")
+            model_id = model_id.replace(" ", "-")
+        else:
+            model_id = _RE_BAD_CHARS.sub("", name_lower)
+            model_id = _RE_WS.sub("-", model_id)
         return model_id, name
 
 
@@ -7,7 +7,7 @@ from typing import Dict, List, Optional, Tuple
 
 import httpx
 
-from config import settings
+from config import get_settings
 from models import ModelPricing, Pricing, BatchPricing
 from .base import BaseProvider, detect_modalities
 from .registry import ProviderRegistry
@@ -160,6 +160,7 @@ class AzureOpenAIProvider(BaseProvider):
     async def fetch(self) -> List[ModelPricing]:
         """Fetch pricing from Azure Retail Prices API."""
         models: Dict[str, ModelPricing] = {}
+        settings = get_settings()
 
         async with httpx.AsyncClient(timeout=settings.http_timeout) as client:
             # Filter for Foundry Models service (AI models)
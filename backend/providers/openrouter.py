@@ -10,7 +10,7 @@ from typing import Dict, List, Optional, Union
 
 import httpx
 
-from config import settings
+from config import get_settings
 from models import ModelPricing, Pricing
 from .base import BaseProvider, detect_modalities
 from .registry import ProviderRegistry
@@ -26,6 +26,7 @@ class OpenRouterProvider(BaseProvider):
 
     async def fetch(self) -> List[ModelPricing]:
         """Fetch pricing from OpenRouter API."""
+        settings = get_settings()
         async with httpx.AsyncClient(timeout=settings.http_timeout) as client:
             resp = await client.get(settings.openrouter_url)
             resp.raise_for_status()
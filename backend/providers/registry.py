@@ -3,10 +3,11 @@
 import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
-from .base import BaseProvider
+from config import get_settings
 from models import ModelPricing
+from .base import BaseProvider
 
 logger = logging.getLogger(__name__)
 
@@ -32,9 +33,27 @@ class ProviderRegistry:
         """Get all registered providers."""
         return list(cls._providers.values())
 
+    @classmethod
+    async def _fetch_each(cls) -> List[Union[List[ModelPricing], BaseException]]:
+        """Fetch all providers concurrently, at most N at a time.
+
+        Results are in registration order. Failures are returned rather than
+        raised, so one failing provider doesn't cancel the others.
+        """
+        semaphore = asyncio.Semaphore(get_settings().provider_fetch_concurrency)
+
+        async def fetch_one(provider: BaseProvider) -> List[ModelPricing]:
+            async with semaphore:
+                return await provider.fetch()
+
+        return await asyncio.gather(
+            *(fetch_one(p) for p in cls._providers.values()),
+            return_exceptions=True,
+        )
+
     @classmethod
     async def fetch_all(cls) -> List[ModelPricing]:
-        """Fetch from all providers concurrently.
+        """Fetch from all providers concurrently (bounded).
 
         Failed providers are logged but don't stop other fetches.
         """
@@ -42,8 +61,7 @@ class ProviderRegistry:
             logger.warning("No providers registered")
             return []
 
-        tasks = [p.fetch() for p in cls._providers.values()]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await cls._fetch_each()
 
         all_models: List[ModelPricing] = []
         for provider, result in zip(cls._providers.values(), results):
@@ -74,8 +92,7 @@ class ProviderRegistry:
             logger.warning("No providers registered")
             return {}
 
-        tasks = [p.fetch() for p in cls._providers.values()]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await cls._fetch_each()
 
         grouped: Dict[str, List[ModelPricing]] = {}
         for provider, result in zip(cls._providers.values(), results):
@@ -44,15 +44,16 @@ class Fetcher:
             provider_stats[provider_name] = len(models)
             total_models += len(models)
 
-        elapsed = (datetime.now() - start).total_seconds()
-        logger.info(f"Refresh complete: {total_models} models in {elapsed:.2f}s")
+        finished = datetime.now()
+        elapsed = (finished - start).total_seconds()
+        logger.info("Refresh complete: %d models in %.2fs", total_models, elapsed)
 
         return {
             "status": "ok",
             "models_count": total_models,
             "providers": provider_stats,
             "elapsed_seconds": elapsed,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": finished.isoformat(),
         }
 
     @classmethod
@@ -63,7 +64,7 @@ class Fetcher:
             provider_name: The provider to refresh.
             include_metadata: If True, also enrich models with metadata from LiteLLM.
         """
-        logger.info(f"Refreshing provider: {provider_name}")
+        logger.info("Refreshing provider: %s", provider_name)
         start = datetime.now()
 
         models = await ProviderRegistry.fetch_provider(provider_name)
@@ -74,13 +75,14 @@ class Fetcher:
 
         PricingService.update_provider(provider_name, models)
 
-        elapsed = (datetime.now() - start).total_seconds()
-        logger.info(f"Provider {provider_name}: {len(models)} models in {elapsed:.2f}s")
+        finished = datetime.now()
+        elapsed = (finished - start).total_seconds()
+        logger.info("Provider %s: %d models in %.2fs", provider_name, len(models), elapsed)
 
         return {
             "status": "ok",
             "provider": provider_name,
             "models_count": len(models),
             "elapsed_seconds": elapsed,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": finished.isoformat(),
         }
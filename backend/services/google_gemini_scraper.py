@@ -12,7 +12,7 @@ import sys
 from dataclasses import dataclass, field
 from typing import Optional
 
-from config import settings
+from config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +33,7 @@ def _ensure_browsers_installed() -> bool:
             [sys.executable, "-m", "playwright", "install", "chromium"],
             capture_output=True,
             text=True,
-            timeout=settings.scraper_subprocess_timeout,
+            timeout=get_settings().scraper_subprocess_timeout,
         )
         if result.returncode == 0:
             logger.info("Playwright chromium installed successfully")
@@ -254,6 +254,8 @@ async def scrape_gemini_api_pricing() -> list[ScrapedGoogleModel]:
             "Playwright is not installed. Run: uv add playwright && playwright install chromium"
         )
 
+    settings = get_settings()
+
     if not _ensure_browsers_installed():
         raise RuntimeError("Failed to install Playwright browser")
 
@@ -9,7 +9,7 @@ from typing import Any, Dict, List, Optional, Union
 
 import httpx
 
-from config import settings
+from config import get_settings
 from models.pricing import ModelPricing
 
 logger = logging.getLogger(__name__)
@@ -79,6 +79,7 @@ class MetadataFetcher:
             return cls._litellm_cache
 
         logger.info("Fetching LiteLLM model data...")
+        settings = get_settings()
         try:
             async with httpx.AsyncClient(timeout=settings.metadata_timeout) as client:
                 response = await client.get(settings.litellm_url)
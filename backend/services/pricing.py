@@ -1,10 +1,13 @@
 """Pricing data service for CRUD and query operations."""
 
-import json
 import logging
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import orjson
 
 from models import (
     IndexFile,
@@ -24,6 +27,14 @@ INDEX_FILE = DATA_DIR / "index.json"
 # Legacy single file (for backward compatibility)
 LEGACY_DATA_FILE = DATA_DIR / "pricing.json"
 
+# Sort keys supported by get_all(); other sort_by values keep storage order
+SORT_KEYS: Dict[str, Callable[[ModelPricing], Any]] = {
+    "model_name": lambda m: m.model_name.lower(),
+    "input": lambda m: m.pricing.input or 0,
+    "output": lambda m: m.pricing.output or 0,
+    "context_length": lambda m: m.context_length or 0,
+}
+
 
 class PricingService:
     """Service for managing pricing data."""
@@ -31,6 +42,24 @@ class PricingService:
     # In-memory cache for loaded models
     _cache: Optional[List[ModelPricing]] = None
     _cache_index: Optional[IndexFile] = None
+    # Bumped on every data change; part of the get_all() query cache key
+    _cache_version: int = 0
+    # Serialized unfiltered catalog and the data version it was built from
+    _all_json: Optional[bytes] = None
+    _all_json_version: int = -1
+
+    # Query indexes derived from the loaded models (see _ensure_query_index)
+    _index_version: int = -1
+    _sorted_views: Dict[Tuple[str, bool], List[ModelPricing]] = {}
+    _by_id: Dict[str, ModelPricing] = {}
+    # provider -> models, in storage order and per sorted view
+    _by_provider: Dict[str, List[ModelPricing]] = {}
+    _sorted_views_by_provider: Dict[Tuple[str, bool], Dict[str, List[ModelPricing]]] = {}
+    # Keyed by id(model), not model.id, since model IDs are not guaranteed
+    # unique; the indexed models stay referenced by _sorted_views
+    _name_lower_by_model: Dict[int, str] = {}
+    _family_by_model: Dict[int, str] = {}
+    _trigram_index: Dict[str, Set[int]] = {}
 
     @classmethod
     def _ensure_data_dir(cls) -> None:
@@ -43,6 +72,10 @@ class PricingService:
         """Invalidate the in-memory cache after data changes."""
         cls._cache = None
         cls._cache_index = None
+        cls._cache_version += 1
+        # Results are keyed by version already; clearing just frees stale entries
+        cls._query_models.cache_clear()
+        cls._all_json = None
 
     # ========== New split-file methods ==========
 
@@ -53,8 +86,7 @@ class PricingService:
             return None
         try:
             with open(INDEX_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return IndexFile.model_validate(data)
+                return IndexFile.model_validate_json(f.read())
         except Exception as e:
             logger.error(f"Failed to load index: {e}")
             return None
@@ -77,8 +109,7 @@ class PricingService:
             return None
         try:
             with open(provider_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return ProviderFile.model_validate(data)
+                return ProviderFile.model_validate_json(f.read())
         except Exception as e:
             logger.error(f"Failed to load provider {provider_name}: {e}")
             return None
@@ -164,8 +195,7 @@ class PricingService:
         if LEGACY_DATA_FILE.exists():
             try:
                 with open(LEGACY_DATA_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                db = PricingDatabase.model_validate(data)
+                    db = PricingDatabase.model_validate_json(f.read())
                 cls._cache = db.models
                 return db
             except Exception as e:
@@ -466,49 +496,201 @@ class PricingService:
         search: Optional[str] = None,
         sort_by: str = "model_name",
         sort_order: str = "asc",
+        limit: Optional[int] = None,
     ) -> List[ModelPricing]:
-        """Get all models with optional filters and sorting."""
-        db = cls._load_database()
-        models = db.models
+        """Get all models with optional filters, sorting and limit.
+
+        Results are cached per query until the data changes.
+        """
+        return cls._query_models(
+            cls._cache_version,
+            provider,
+            capability,
+            family,
+            search.lower() if search else None,
+            *cls._normalize_sort(sort_by, sort_order),
+            cls._normalize_limit(limit),
+        )
+
+    @classmethod
+    def get_all_json(
+        cls,
+        provider: Optional[str] = None,
+        capability: Optional[str] = None,
+        family: Optional[str] = None,
+        search: Optional[str] = None,
+        sort_by: str = "model_name",
+        sort_order: str = "asc",
+        limit: Optional[int] = None,
+    ) -> bytes:
+        """Same as get_all(), serialized to JSON bytes.
+
+        The unfiltered, default-sorted catalog (the common request) is
+        serialized once per data version; other queries are serialized from
+        the cached get_all() result on each call.
+        """
+        is_default = (
+            not (provider or capability or family or search)
+            and cls._normalize_sort(sort_by, sort_order) == ("model_name", "asc")
+            and cls._normalize_limit(limit) is None
+        )
+        if is_default and cls._all_json_version == cls._cache_version:
+            return cls._all_json
+
+        models = cls.get_all(
+            provider, capability, family, search, sort_by, sort_order, limit
+        )
+        content = orjson.dumps([m.model_dump(mode="json") for m in models])
+        if is_default:
+            cls._all_json = content
+            cls._all_json_version = cls._cache_version
+        return content
+
+    @staticmethod
+    def _normalize_sort(sort_by: str, sort_order: str) -> Tuple[str, str]:
+        """Canonicalize sort options so arbitrary values share one cache entry.
+
+        Unknown sort keys keep storage order in either direction.
+        """
+        if sort_by not in SORT_KEYS:
+            return "", "asc"
+        return sort_by, "desc" if sort_order == "desc" else "asc"
+
+    @classmethod
+    def _normalize_limit(cls, limit: Optional[int]) -> Optional[int]:
+        """Drop limits that cannot truncate, so they share the unlimited entry."""
+        if limit is not None and limit >= len(cls._ensure_query_index()):
+            return None
+        return limit
 
-        # Filter by provider
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _query_models(
+        cls,
+        version: int,
+        provider: Optional[str],
+        capability: Optional[str],
+        family: Optional[str],
+        search: Optional[str],
+        sort_by: str,
+        sort_order: str,
+        limit: Optional[int],
+    ) -> List[ModelPricing]:
+        """Filter and sort models. Cached by get_all(); do not mutate the result."""
+        models = cls._ensure_query_index()
+        view_key = (sort_by, sort_order == "desc")
         if provider:
-            models = [m for m in models if m.provider == provider]
-
-        # Filter by capability
-        if capability:
-            models = [m for m in models if capability in m.capabilities]
-
-        # Filter by model family
-        if family:
-            models = [m for m in models if cls.extract_model_family(m.model_name) == family]
-
-        # Search by model name
-        if search:
-            search_lower = search.lower()
-            models = [m for m in models if search_lower in m.model_name.lower()]
-
-        # Sort
-        reverse = sort_order == "desc"
-        if sort_by == "model_name":
-            models.sort(key=lambda m: m.model_name.lower(), reverse=reverse)
-        elif sort_by == "input":
-            models.sort(key=lambda m: m.pricing.input or 0, reverse=reverse)
-        elif sort_by == "output":
-            models.sort(key=lambda m: m.pricing.output or 0, reverse=reverse)
-        elif sort_by == "context_length":
-            models.sort(key=lambda m: m.context_length or 0, reverse=reverse)
+            # Start from the provider's own slice instead of comparing every model
+            by_provider = cls._sorted_views_by_provider.get(view_key, cls._by_provider)
+            view = by_provider.get(provider, [])
+        else:
+            view = cls._sorted_views.get(view_key, models)
+        return cls._filter_models(view, None, capability, family, search, limit)
+
+    # ========== Query indexes ==========
+
+    @classmethod
+    def _ensure_query_index(cls) -> List[ModelPricing]:
+        """Build query indexes for the current data version if needed.
+
+        Pre-sorts the models once per sort key and direction (overall and per
+        provider), and precomputes ID lookup, lowercased names, model families
+        and a name trigram index, so queries are a single filtering pass over
+        a ready-made view.
 
+        Returns the loaded models in storage order.
+        """
+        models = cls._cache if cls._cache is not None else cls._load_database().models
+        if cls._index_version == cls._cache_version:
+            return models
+
+        # Both directions are sorted separately (not reversed) so ties keep
+        # their storage order, as with sort(reverse=True)
+        cls._sorted_views = {
+            (sort_by, reverse): sorted(models, key=key, reverse=reverse)
+            for sort_by, key in SORT_KEYS.items()
+            for reverse in (False, True)
+        }
+        cls._by_provider = cls._group_by_provider(models)
+        cls._sorted_views_by_provider = {
+            view_key: cls._group_by_provider(view)
+            for view_key, view in cls._sorted_views.items()
+        }
+        # Reversed so the first model wins on duplicate IDs, like a linear scan
+        cls._by_id = {m.id: m for m in reversed(models)}
+        cls._name_lower_by_model = {id(m): m.model_name.lower() for m in models}
+        cls._family_by_model = {
+            id(m): cls.extract_model_family(m.model_name) for m in models
+        }
+
+        trigrams: Dict[str, Set[int]] = {}
+        for model_key, name in cls._name_lower_by_model.items():
+            for i in range(len(name) - 2):
+                trigrams.setdefault(name[i:i + 3], set()).add(model_key)
+        cls._trigram_index = trigrams
+
+        cls._index_version = cls._cache_version
         return models
 
+    @staticmethod
+    def _group_by_provider(models: List[ModelPricing]) -> Dict[str, List[ModelPricing]]:
+        """Group models by provider, preserving their order."""
+        grouped: Dict[str, List[ModelPricing]] = {}
+        for model in models:
+            grouped.setdefault(model.provider, []).append(model)
+        return grouped
+
+    @classmethod
+    def _search_matches(cls, search: str) -> Set[int]:
+        """Get id() of models whose name contains search (case-insensitive)."""
+        search_lower = search.lower()
+        if len(search_lower) >= 3:
+            # Only names containing every trigram of the query can match
+            postings = sorted(
+                (
+                    cls._trigram_index.get(search_lower[i:i + 3], set())
+                    for i in range(len(search_lower) - 2)
+                ),
+                key=len,
+            )
+            candidates: Iterable[int] = set.intersection(*postings)
+        else:
+            candidates = cls._name_lower_by_model.keys()
+        return {
+            model_key for model_key in candidates
+            if search_lower in cls._name_lower_by_model[model_key]
+        }
+
+    @classmethod
+    def _filter_models(
+        cls,
+        models: List[ModelPricing],
+        provider: Optional[str] = None,
+        capability: Optional[str] = None,
+        family: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[ModelPricing]:
+        """Apply all filters in a single pass, preserving order.
+
+        With a limit, iteration stops as soon as enough models matched.
+        Requires _ensure_query_index() to have been called.
+        """
+        search_matches = cls._search_matches(search) if search else None
+        matches = (
+            m for m in models
+            if (not provider or m.provider == provider)
+            and (not capability or capability in m.capabilities)
+            and (not family or cls._family_by_model[id(m)] == family)
+            and (search_matches is None or id(m) in search_matches)
+        )
+        return list(islice(matches, limit))
+
     @classmethod
     def get_by_id(cls, model_id: str) -> Optional[ModelPricing]:
         """Get a single model by ID."""
-        db = cls._load_database()
-        for model in db.models:
-            if model.id == model_id:
-                return model
-        return None
+        cls._ensure_query_index()
+        return cls._by_id.get(model_id)
 
     @classmethod
     def get_providers(
@@ -518,17 +700,13 @@ class PricingService:
         search: Optional[str] = None,
     ) -> List[ProviderInfo]:
         """Get list of all providers with stats, filtered by other conditions."""
-        db = cls._load_database()
-        models = db.models
-
         # Apply filters (except provider itself)
-        if capability:
-            models = [m for m in models if capability in m.capabilities]
-        if family:
-            models = [m for m in models if cls.extract_model_family(m.model_name) == family]
-        if search:
-            search_lower = search.lower()
-            models = [m for m in models if search_lower in m.model_name.lower()]
+        models = cls._filter_models(
+            cls._ensure_query_index(),
+            capability=capability,
+            family=family,
+            search=search,
+        )
 
         provider_stats: Dict[str, dict] = {}
 
@@ -572,22 +750,16 @@ class PricingService:
         search: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Get list of all model families with counts, filtered by other conditions."""
-        db = cls._load_database()
-        models = db.models
-
         # Apply filters (except family itself)
+        models = cls._ensure_query_index()
         if provider:
-            models = [m for m in models if m.provider == provider]
-        if capability:
-            models = [m for m in models if capability in m.capabilities]
-        if search:
-            search_lower = search.lower()
-            models = [m for m in models if search_lower in m.model_name.lower()]
+            models = cls._by_provider.get(provider, [])
+        models = cls._filter_models(models, capability=capability, search=search)
 
         family_stats: Dict[str, int] = {}
 
         for model in models:
-            family = cls.extract_model_family(model.model_name)
+            family = cls._family_by_model[id(model)]
             family_stats[family] = family_stats.get(family, 0) + 1
 
         # Sort by count descending, then by name
@@ -752,8 +924,7 @@ class PricingService:
 
         # Load from legacy file
         with open(LEGACY_DATA_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        legacy_db = PricingDatabase.model_validate(data)
+            legacy_db = PricingDatabase.model_validate_json(f.read())
 
         # Group by provider
         by_provider: Dict[str, List[ModelPricing]] = {}